@@ -39,7 +39,9 @@ class NotifyType(str, Enum):
 
 
 # Define our types so we can verify if we need to
-NOTIFY_TYPES: frozenset[str] = frozenset(e.value for e in NotifyType)
+NOTIFY_TYPES: frozenset[str] = frozenset(
+    {"info", "success", "warning", "failure"}
+)
 
 
 class NotifyImageSize(str, Enum):
@@ -53,8 +55,9 @@ class NotifyImageSize(str, Enum):
 
 
 # Define our image sizes so we can verify if we need to
-NOTIFY_IMAGE_SIZES: frozenset[str] = \
-    frozenset(e.value for e in NotifyImageSize)
+NOTIFY_IMAGE_SIZES: frozenset[str] = frozenset(
+    {"32x32", "72x72", "128x128", "256x256"}
+)
 
 
 class NotifyFormat(str, Enum):
@@ -67,7 +70,7 @@ class NotifyFormat(str, Enum):
 
 
 # Define our formats so we can verify if we need to
-NOTIFY_FORMATS: frozenset[str] = frozenset(e.value for e in NotifyFormat)
+NOTIFY_FORMATS: frozenset[str] = frozenset({"text", "html", "markdown"})
 
 
 class OverflowMode(str, Enum):
@@ -89,7 +92,7 @@ class OverflowMode(str, Enum):
 
 
 # Define our modes so we can verify if we need to
-OVERFLOW_MODES: frozenset[str] = frozenset(e.value for e in OverflowMode)
+OVERFLOW_MODES: frozenset[str] = frozenset({"upstream", "truncate", "split"})
 
 
 class ConfigFormat(str, Enum):
@@ -107,7 +110,7 @@ class ConfigFormat(str, Enum):
 
 
 # Define our configuration formats mostly used for verification
-CONFIG_FORMATS: frozenset[str] = frozenset(e.value for e in ConfigFormat)
+CONFIG_FORMATS: frozenset[str] = frozenset({"text", "yaml"})
 
 
 class ContentIncludeMode(str, Enum):
@@ -130,8 +133,9 @@ class ContentIncludeMode(str, Enum):
 
 
 # Define our file inclusion types so we can verify if we need to
-CONTENT_INCLUDE_MODES: frozenset[str] = \
-    frozenset(e.value for e in ContentIncludeMode)
+CONTENT_INCLUDE_MODES: frozenset[str] = frozenset(
+    {"strict", "never", "always"}
+)
 
 
 class ContentLocation(str, Enum):
@@ -158,7 +162,7 @@ class ContentLocation(str, Enum):
 
 
 # Define our location types so we can verify if we need to
-CONTENT_LOCATIONS: frozenset[str] = frozenset(e.value for e in ContentLocation)
+CONTENT_LOCATIONS: frozenset[str] = frozenset({"local", "hosted", "n/a"})
 
 
 class PersistentStoreMode(str, Enum):
@@ -174,8 +178,7 @@ class PersistentStoreMode(str, Enum):
 
 
 # Define our persistent storage modes so we can verify if we need to
-PERSISTENT_STORE_MODES: frozenset[str] = \
-    frozenset(e.value for e in PersistentStoreMode)
+PERSISTENT_STORE_MODES: frozenset[str] = frozenset({"auto", "flush", "memory"})
 
 
 class PersistentStoreState(str, Enum):
@@ -194,8 +197,9 @@ class PersistentStoreState(str, Enum):
 
 
 # Define our persistent storage states so we can verify if we need to
-PERSISTENT_STORE_STATES: frozenset[str] = \
-    frozenset(e.value for e in PersistentStoreState)
+PERSISTENT_STORE_STATES: frozenset[str] = frozenset(
+    {"active", "stale", "unused"}
+)
 
 # This is a reserved tag that is automatically assigned to every
 # Notification Plugin
@@ -31,6 +31,7 @@ import inspect
 import os
 from os.path import abspath, dirname, join
 import re
+import stat
 import sys
 import threading
 import time
@@ -38,7 +39,7 @@ import time
 from .logger import logger
 from .utils.disk import path_decode
 from .utils.module import import_module
-from .utils.parse import parse_list
+from .utils.parse import VALID_PYTHON_FILE_RE, parse_list
 from .utils.singleton import Singleton
 
 
@@ -61,6 +62,15 @@ class PluginManager(metaclass=Singleton):
     # For filtering our result when scanning a module
     module_filter_re = re.compile(r"^(?P<name>((?!_)[A-Za-z0-9]+))$")
 
+    # Used when scanning for custom modules; a simple restriction that we
+    # don't allow periods in the filename at all so it can't be hidden (Linux
+    # OS's) and it won't conflict with Python path naming.  This also
+    # prevents us from loading any python file that starts with an underscore
+    # or dash.  We allow for __init__.py as well
+    module_detection_re = re.compile(
+        r"^(?P<name>[_a-z0-9][a-z0-9._-]+)?(\.py)?$", re.I
+    )
+
     # thread safe loading
     _lock = threading.Lock()
 
@@ -291,17 +301,7 @@ class PluginManager(metaclass=Singleton):
     def module_detection(self, paths, cache=True):
         """Leverage the @notify decorator and load all objects found matching
         this."""
-        # A simple restriction that we don't allow periods in the filename at
-        # all so it can't be hidden (Linux OS's) and it won't conflict with
-        # Python path naming.  This also prevents us from loading any python
-        # file that starts with an underscore or dash
-        # We allow for __init__.py as well
-        module_re = re.compile(
-            r"^(?P<name>[_a-z0-9][a-z0-9._-]+)?(\.py)?$", re.I
-        )
-
-        # Validate if we're a loadable Python file or not
-        valid_python_file_re = re.compile(r".+\.py(o|c)?$", re.IGNORECASE)
+        module_re = self.module_detection_re
 
         if isinstance(paths, str):
             paths = [
@@ -316,7 +316,7 @@ class PluginManager(metaclass=Singleton):
             # Since our plugin name can conflict (as a module) with another
             # we want to generate random strings to avoid steping on
             # another's namespace
-            if not (path and valid_python_file_re.match(path)):
+            if not (path and VALID_PYTHON_FILE_RE.match(path)):
                 # Ignore file/module type
                 logger.trace("Plugin Scan: Skipping %s", path)
                 return
@@ -386,35 +386,47 @@ class PluginManager(metaclass=Singleton):
 
         for _path in paths:
             path = path_decode(_path)
-            if (
-                cache and path in self._paths_previously_scanned
-            ) or not os.path.exists(path):
+            if cache and path in self._paths_previously_scanned:
                 # We're done as we've already scanned this
                 continue
 
+            try:
+                # A single stat() tells us both if our path exists and
+                # whether or not it is a directory
+                is_dir = stat.S_ISDIR(os.stat(path).st_mode)
+
+            except (OSError, ValueError):
+                # Our path does not exist (or is not accessible)
+                continue
+
             # Store our path as a way of hashing it has been handled
             self._paths_previously_scanned.add(path)
 
-            if os.path.isdir(path) and not os.path.isfile(
+            if is_dir and not os.path.isfile(
                 os.path.join(path, "__init__.py")
             ):
 
                 logger.debug("Scanning for custom plugins in: %s", path)
-                for entry in os.listdir(path):
-                    re_match = module_re.match(entry)
+                with os.scandir(path) as it:
+                    # Directory entries carry their own (cached) file type
+                    # information so we avoid having to stat each of them
+                    # again ourselves
+                    entries = list(it)
+
+                for entry in entries:
+                    re_match = module_re.match(entry.name)
                     if not re_match:
                         # keep going
-                        logger.trace("Plugin Scan: Ignoring %s", entry)
+                        logger.trace("Plugin Scan: Ignoring %s", entry.name)
                         continue
 
-                    new_path = os.path.join(path, entry)
-                    if os.path.isdir(new_path):
+                    new_path = entry.path
+                    if entry.is_dir():
                         # Update our path
-                        new_path = os.path.join(path, entry, "__init__.py")
+                        new_path = os.path.join(entry.path, "__init__.py")
                         if not os.path.isfile(new_path):
                             logger.trace(
-                                "Plugin Scan: Ignoring %s",
-                                os.path.join(path, entry),
+                                "Plugin Scan: Ignoring %s", entry.path
                             )
                             continue
 
@@ -428,7 +440,7 @@ class PluginManager(metaclass=Singleton):
                         # Add our subdir path
                         self._paths_previously_scanned.add(new_path)
             else:
-                if os.path.isdir(path):
+                if is_dir:
                     # This logic is safe to apply because we already
                     # validated the directories state above; update our
                     # path
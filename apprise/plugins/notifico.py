@@ -49,6 +49,21 @@ from ..locale import gettext_lazy as _
 from ..utils.parse import parse_bool, validate_regex
 from .base import NotifyBase
 
+# Used to detect the native Notifico URL
+NOTIFICO_NATIVE_URL_RE = re.compile(
+    r"^https?://n\.tkte\.ch/h/"
+    r"(?P<proj>[0-9]+)/"
+    r"(?P<hook>[A-Z0-9]+)/?"
+    r"(?P<params>\?.+)?$",
+    re.I,
+)
+
+# The (escaped) IRC color code marker that may be found in the message body
+IRC_COLOR_MARKER = "\\x03"
+
+# Used to strip IRC color codes found in the message body
+IRC_COLOR_STRIP_RE = re.compile(r"\\x03(\d{1,2}(,[0-9]{1,2})?)?")
+
 
 class NotificoFormat:
     # Resets all formatting
@@ -74,7 +89,7 @@ class NotificoColor:
     Brown = "\x0305"
     Purple = "\x0306"
     Orange = "\x0307"
-    Yellow = ("\x0308",)
+    Yellow = "\x0308"
     LightGreen = "\x0309"
     Teal = "\x0310"
     LightCyan = "\x0311"
@@ -84,6 +99,16 @@ class NotificoColor:
     LightGrey = "\x0315"
 
 
+# Used as a lookup when building the IRC Prefix; each notification type maps
+# to the color and token [?] placed at the head of the message
+NOTIFICO_PREFIX_MAP = {
+    NotifyType.INFO: (NotificoColor.Teal, "i"),
+    NotifyType.SUCCESS: (NotificoColor.LightGreen, "✔"),
+    NotifyType.WARNING: (NotificoColor.Orange, "!"),
+    NotifyType.FAILURE: (NotificoColor.Red, "✗"),
+}
+
+
 class NotifyNotifico(NotifyBase):
     """A wrapper for Notifico Notifications."""
 
@@ -191,6 +216,12 @@ class NotifyNotifico(NotifyBase):
         # Send colors
         self.color = color
 
+        # Our headers never change between notifications
+        self._headers = {
+            "User-Agent": self.app_id,
+            "Content-Type": "application/x-www-form-urlencoded; charset=utf-8",
+        }
+
         # Prepare our notification URL now:
         self.api_url = self.notify_url.format(
             proj=self.project_id,
@@ -229,69 +260,37 @@ class NotifyNotifico(NotifyBase):
     def send(self, body, title="", notify_type=NotifyType.INFO, **kwargs):
         """Wrapper to _send since we can alert more then one channel."""
 
-        # prepare our headers
-        headers = {
-            "User-Agent": self.app_id,
-            "Content-Type": "application/x-www-form-urlencoded; charset=utf-8",
-        }
-
         # Prepare our IRC Prefix
-        color = ""
-        token = ""
-        if notify_type == NotifyType.INFO:
-            color = NotificoColor.Teal
-            token = "i"
-
-        elif notify_type == NotifyType.SUCCESS:
-            color = NotificoColor.LightGreen
-            token = "✔"
-
-        elif notify_type == NotifyType.WARNING:
-            color = NotificoColor.Orange
-            token = "!"
-
-        elif notify_type == NotifyType.FAILURE:
-            color = NotificoColor.Red
-            token = "✗"
-
-        if self.color:
-            # Colors were specified, make sure we capture and correctly
-            # allow them to exist inline in the message
-            # \g<1> is less ambiguous than \1
-            body = re.sub(r"\\x03(\d{0,2})", r"\\x03\g<1>", body)
-
-        else:
+        color, token = NOTIFICO_PREFIX_MAP.get(notify_type, ("", ""))
+
+        # When colors are specified, any found inline in the message are
+        # passed along as they are
+        if not self.color and IRC_COLOR_MARKER in body:
             # no colors specified, make sure we strip out any colors found
             # to make the string read-able
-            body = re.sub(r"\\x03(\d{1,2}(,[0-9]{1,2})?)?", r"", body)
+            body = IRC_COLOR_STRIP_RE.sub("", body)
+
+        if self.prefix:
+            # Prefix our message with the token [?] (and our App ID)
+            body = (
+                f"{color}[{token}]{NotificoColor.Reset} "
+                f"{NotificoFormat.Bold}{self.app_id}{NotificoFormat.Reset}: "
+                f"{body}{NotificoFormat.Reset}"
+                if self.color
+                else f"[{token}] {self.app_id}: {body}"
+            )
 
         # Prepare our payload
         payload = {
-            "payload": (
-                body
-                if not self.prefix
-                else "{}[{}]{} {}{}{}: {}{}".format(
-                    # Token [?] at the head
-                    color if self.color else "",
-                    token,
-                    NotificoColor.Reset if self.color else "",
-                    # App ID
-                    NotificoFormat.Bold if self.color else "",
-                    self.app_id,
-                    NotificoFormat.Reset if self.color else "",
-                    # Message Body
-                    body,
-                    # Reset
-                    NotificoFormat.Reset if self.color else "",
-                )
-            ),
+            "payload": body,
         }
 
         self.logger.debug(
-            "Notifico GET URL:"
-            f" {self.api_url} (cert_verify={self.verify_certificate!r})"
+            "Notifico GET URL: %s (cert_verify=%r)",
+            self.api_url,
+            self.verify_certificate,
         )
-        self.logger.debug(f"Notifico Payload: {payload!s}")
+        self.logger.debug("Notifico Payload: %s", payload)
 
         # Always call throttle before any remote server i/o is made
         self.throttle()
@@ -300,7 +299,7 @@ class NotifyNotifico(NotifyBase):
             r = requests.get(
                 self.api_url,
                 params=payload,
-                headers=headers,
+                headers=self._headers,
                 verify=self.verify_certificate,
                 timeout=self.request_timeout,
             )
@@ -317,7 +316,7 @@ class NotifyNotifico(NotifyBase):
                     )
                 )
 
-                self.logger.debug(f"Response Details:\r\n{r.content}")
+                self.logger.debug("Response Details:\r\n%s", r.content)
 
                 # Return; we're done
                 return False
@@ -329,7 +328,7 @@ class NotifyNotifico(NotifyBase):
             self.logger.warning(
                 "A Connection error occurred sending Notifico notification."
             )
-            self.logger.debug(f"Socket Exception: {e!s}")
+            self.logger.debug("Socket Exception: %s", e)
 
             # Return; we're done
             return False
@@ -372,14 +371,7 @@ class NotifyNotifico(NotifyBase):
         Support https://n.tkte.ch/h/PROJ_ID/MESSAGE_HOOK/
         """
 
-        result = re.match(
-            r"^https?://n\.tkte\.ch/h/"
-            r"(?P<proj>[0-9]+)/"
-            r"(?P<hook>[A-Z0-9]+)/?"
-            r"(?P<params>\?.+)?$",
-            url,
-            re.I,
-        )
+        result = NOTIFICO_NATIVE_URL_RE.match(url)
 
         if result:
             return NotifyNotifico.parse_url(
@@ -30,7 +30,7 @@ import hashlib
 import re
 import sys
 import time
-from urllib.parse import quote as _quote, unquote as _unquote
+from urllib.parse import quote as _quote
 from xml.sax.saxutils import escape as sax_escape
 
 from .asset import AppriseAsset
@@ -41,6 +41,7 @@ from .utils.parse import (
     parse_list,
     parse_phone_no,
     parse_url,
+    unquote as _unquote,
     urlencode,
 )
 
@@ -403,11 +404,15 @@ class URLBase:
             {"usedforsecurity": False} if sys.version_info >= (3, 9) else {}
         )
 
-        if self.url_identifier is False:
+        # Our identifier is generated on demand by some plugins; only
+        # acquire it once
+        url_identifier = self.url_identifier
+
+        if url_identifier is False:
             # Disabled
             self.__cached_url_identifier = None
 
-        elif self.url_identifier in (None, True):
+        elif url_identifier in (None, True):
 
             # Prepare our object
             engine = hash_engine(
@@ -445,19 +450,19 @@ class URLBase:
             # Save our generated content
             self.__cached_url_identifier = engine.hexdigest()
 
-        elif isinstance(self.url_identifier, str):
+        elif isinstance(url_identifier, str):
             self.__cached_url_identifier = hash_engine(
                 self.asset.storage_salt
-                + self.url_identifier.encode(self.asset.encoding),
+                + url_identifier.encode(self.asset.encoding),
                 **kwargs,
             ).hexdigest()
 
-        elif isinstance(self.url_identifier, bytes):
+        elif isinstance(url_identifier, bytes):
             self.__cached_url_identifier = hash_engine(
-                self.asset.storage_salt + self.url_identifier, **kwargs
+                self.asset.storage_salt + url_identifier, **kwargs
             ).hexdigest()
 
-        elif isinstance(self.url_identifier, (list, tuple, set)):
+        elif isinstance(url_identifier, (list, tuple, set)):
             self.__cached_url_identifier = hash_engine(
                 self.asset.storage_salt
                 + b"".join([
@@ -466,12 +471,12 @@ class URLBase:
                         if isinstance(x, bytes)
                         else str(x).encode(self.asset.encoding)
                     )
-                    for x in self.url_identifier
+                    for x in url_identifier
                 ]),
                 **kwargs,
             ).hexdigest()
 
-        elif isinstance(self.url_identifier, dict):
+        elif isinstance(url_identifier, dict):
             self.__cached_url_identifier = hash_engine(
                 self.asset.storage_salt
                 + b"".join([
@@ -480,7 +485,7 @@ class URLBase:
                         if isinstance(x, bytes)
                         else str(x).encode(self.asset.encoding)
                     )
-                    for x in self.url_identifier.values()
+                    for x in url_identifier.values()
                 ]),
                 **kwargs,
             ).hexdigest()
@@ -488,7 +493,7 @@ class URLBase:
         else:
             self.__cached_url_identifier = hash_engine(
                 self.asset.storage_salt
-                + str(self.url_identifier).encode(self.asset.encoding),
+                + str(url_identifier).encode(self.asset.encoding),
                 **kwargs,
             ).hexdigest()
 
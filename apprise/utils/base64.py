@@ -89,10 +89,13 @@ def encode_b64_dict(di: dict, encoding="utf-8") -> tuple[dict, bool]:
 
     Final product is always string based values
     """
-    di = copy.deepcopy(di)
+    # Every value we return is a (newly generated) string, so there is no
+    # need to deep copy the dictionary we were provided first
+    result = {}
     needs_decoding = False
     for k, v in di.items():
         if isinstance(v, str):
+            result[k] = v
             continue
 
         try:
@@ -108,5 +111,5 @@ def encode_b64_dict(di: dict, encoding="utf-8") -> tuple[dict, bool]:
             #  - bytes object not passed into urlsafe_b64encode()
             encoded = str(v)
 
-        di[k] = encoded
-    return di, needs_decoding
+        result[k] = encoded
+    return result, needs_decoding
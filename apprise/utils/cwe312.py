@@ -28,6 +28,22 @@ import re
 
 from .parse import is_hostname, parse_url
 
+# Used to break apart the path of the URL being masked
+CWE312_PATH_SPLIT_RE = re.compile(r"[\\/]+")
+
+
+class Variance:
+    """A Simple List of Possible Character Variances."""
+
+    # An Upper Case Character (ABCDEF... etc)
+    ALPHA_UPPER = "+"
+    # An Lower Case Character (abcdef... etc)
+    ALPHA_LOWER = "-"
+    # A Special Character ($%^;... etc)
+    SPECIAL = "s"
+    # A Numerical Character (1234... etc)
+    NUMERIC = "n"
+
 
 def cwe312_word(word, force=False, advanced=True, threshold=5):
     """This function was written to help mask secure/private information that
@@ -47,18 +63,6 @@ def cwe312_word(word, force=False, advanced=True, threshold=5):
     reached, then content is considered secret
     """
 
-    class Variance:
-        """A Simple List of Possible Character Variances."""
-
-        # An Upper Case Character (ABCDEF... etc)
-        ALPHA_UPPER = "+"
-        # An Lower Case Character (abcdef... etc)
-        ALPHA_LOWER = "-"
-        # A Special Character ($%^;... etc)
-        SPECIAL = "s"
-        # A Numerical Character (1234... etc)
-        NUMERIC = "n"
-
     if not (isinstance(word, str) and word.strip()):
         # not a password if it's not something we even support
         return word
@@ -157,7 +161,9 @@ def cwe312_url(url):
         "/"
         + "/".join([
             cwe312_word(x)
-            for x in re.split(r"[\\/]+", results["fullpath"].lstrip("/"))
+            for x in CWE312_PATH_SPLIT_RE.split(
+                results["fullpath"].lstrip("/")
+            )
         ])
         if results["fullpath"]
         else ""
@@ -34,7 +34,6 @@ from ..logger import logger
 # Pre-Escape content since we reference it so much
 ESCAPED_PATH_SEPARATOR = re.escape("\\/")
 ESCAPED_WIN_PATH_SEPARATOR = re.escape("\\")
-ESCAPED_NUX_PATH_SEPARATOR = re.escape("/")
 
 TIDY_WIN_PATH_RE = re.compile(
     rf"(^[{ESCAPED_WIN_PATH_SEPARATOR}]{{2}}|[^{ESCAPED_WIN_PATH_SEPARATOR}\s][{ESCAPED_WIN_PATH_SEPARATOR}]|[\s][{ESCAPED_WIN_PATH_SEPARATOR}]{{2}}])([{ESCAPED_WIN_PATH_SEPARATOR}]+)",
@@ -43,10 +42,6 @@ TIDY_WIN_TRIM_RE = re.compile(
     rf"^(.+[^:][^{ESCAPED_WIN_PATH_SEPARATOR}])[\s{ESCAPED_WIN_PATH_SEPARATOR}]*$",
 )
 
-TIDY_NUX_PATH_RE = re.compile(
-    rf"([{ESCAPED_NUX_PATH_SEPARATOR}])([{ESCAPED_NUX_PATH_SEPARATOR}]+)",
-)
-
 # A simple path decoder we can re-use which looks after
 # ensuring our file info is expanded correctly when provided
 # a path.
@@ -69,10 +64,14 @@ def tidy_path(path):
     For example: ////absolute//path// becomes:
         /absolute/path
     """
-    # Windows
-    path = TIDY_WIN_PATH_RE.sub("\\1", path.strip())
+    path = path.strip()
+    if "\\" in path:
+        # Windows
+        path = TIDY_WIN_PATH_RE.sub("\\1", path)
+
     # Linux
-    path = TIDY_NUX_PATH_RE.sub("\\1", path)
+    while "//" in path:
+        path = path.replace("//", "/")
 
     # Windows Based (final) Trim
     path = expanduser(TIDY_WIN_TRIM_RE.sub("\\1", path))
@@ -75,6 +75,10 @@ def is_exclusive_match(
     # against anything
     matched = False
 
+    # The tags we compare our logic against (along with our match_all tag);
+    # this is only prepared once we have an entry worth comparing
+    haystack = None
+
     # Every entry here will be or'ed with the next
     for entry in logic:
         if not isinstance(entry, (str, list, tuple, set)):
@@ -90,7 +94,10 @@ def is_exclusive_match(
             # match if there is also no data to match against
             return not data
 
-        if len(entries.intersection(data.union({match_all}))) == len(entries):
+        if haystack is None:
+            haystack = data.union({match_all})
+
+        if entries.issubset(haystack):
             # our set contains all of the entries found
             # in our notification data set
             matched = True
@@ -111,16 +118,13 @@ def dict_full_update(dict1, dict2):
     are also recursively applied.
     """
 
-    def _merge(dict1, dict2):
-        for k in dict2:
-            if (
-                k in dict1
-                and isinstance(dict1[k], dict)
-                and isinstance(dict2[k], dict)
-            ):
-                _merge(dict1[k], dict2[k])
+    # Walk our (nested) dictionaries without the need of recursion
+    stack = [(dict1, dict2)]
+    while stack:
+        dst, src = stack.pop()
+        for k, v in src.items():
+            if isinstance(v, dict) and isinstance(dst.get(k), dict):
+                stack.append((dst[k], v))
             else:
-                dict1[k] = dict2[k]
-
-    _merge(dict1, dict2)
+                dst[k] = v
     return
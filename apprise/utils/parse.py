@@ -24,10 +24,16 @@
 # CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
-import contextlib
-from functools import reduce
+from functools import lru_cache, reduce
 import re
-from urllib.parse import quote, unquote, urlencode as _urlencode, urlparse
+import string
+from urllib.parse import (
+    quote,
+    unquote as _unquote,
+    unquote_to_bytes,
+    urlencode as _urlencode,
+    urlparse,
+)
 
 from .disk import tidy_path
 
@@ -43,19 +49,56 @@ VALID_URL_RE = re.compile(
 )
 VALID_QUERY_RE = re.compile(r"^(?P<path>.*[/\\])(?P<query>[^/\\]+)?$")
 
-# delimiters used to separate values when content is passed in by string.
-# This is useful when turning a string into a list
-STRING_DELIMITERS = r"[\[\]\;,\s]+"
+# Used to break apart the user (and password) from the host of a URL in a
+# single pass; only the content up to the second @ (if one is present) and
+# the second : found in the user portion is used
+URL_NETLOC_RE = re.compile(
+    r"^(?:(?P<user>[^@:]*)(?::+(?P<password>[^@:]*)[^@]*)?@+)?"
+    r"(?P<host>[^@]*)"
+)
+
+# Used to separate the port (if one was specified) from the host of a URL
+URL_HOST_PORT_RE = re.compile(
+    r"^(?P<host>(\[[0-9a-f:]+\]|[^:]+)):(?P<port>[^:]*)$"
+)
+
+# Used to detect if a port contains any digits at all
+URL_PORT_DIGIT_RE = re.compile(r"[0-9]")
+
+# The characters a hostname may be made up of when parsed through the
+# parse_url() fast path; anything else is handled by the full parser
+SIMPLE_URL_HOST_CHARS = frozenset(string.ascii_letters + string.digits + ".-_")
+
+# The characters that prevent a URL from being broken apart by a simple scan
+# for its delimiters in parse_url()
+URL_SCAN_UNSAFE_CHARS = frozenset(string.whitespace + "#;[]\\")
+
+# delimiters used to separate values when content is passed in by string
+# (in addition to whitespace). This is useful when turning a string into a
+# list
+STRING_DELIMITER_CHARS = r"\[\]\;,"
+
+STRING_DELIMITERS = rf"[{STRING_DELIMITER_CHARS}\s]+"
 
 # String Delimiters without the whitespace
-STRING_DELIMITERS_NO_WS = r"[\[\]\;,]+"
+STRING_DELIMITERS_NO_WS = rf"[{STRING_DELIMITER_CHARS}]+"
+
+# Used to extract the content found between our STRING_DELIMITERS (and
+# STRING_DELIMITERS_NO_WS); this is the same as splitting on them and
+# dropping the empty entries, but without ever creating those entries
+STRING_DELIMITED_RE = re.compile(rf"[^{STRING_DELIMITER_CHARS}\s]+")
+STRING_DELIMITED_NO_WS_RE = re.compile(rf"[^{STRING_DELIMITER_CHARS}]+")
 
 # The handling of custom arguments passed in the URL; we treat any
 # argument (which would otherwise appear in the qsd area of our parse_url()
-# function differently if they start with a +, - or : value
-NOTIFY_CUSTOM_ADD_TOKENS = re.compile(r"^( |\+)(?P<key>.*)\s*")
-NOTIFY_CUSTOM_DEL_TOKENS = re.compile(r"^-(?P<key>.*)\s*")
-NOTIFY_CUSTOM_COLON_TOKENS = re.compile(r"^:(?P<key>.*)\s*")
+# function differently if they start with a +, - or : value.  A leading
+# space is a + that was decoded before we got to it.
+NOTIFY_CUSTOM_TOKEN_MAP = {
+    "+": "qsd+",
+    " ": "qsd+",
+    "-": "qsd-",
+    ":": "qsd:",
+}
 
 # Used for attempting to acquire the schema if the URL can't be parsed.
 GET_SCHEMA_RE = re.compile(r"\s*(?P<schema>[a-z0-9]{1,12})://.*$", re.I)
@@ -140,54 +183,122 @@ UUID4_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Used to validate an IPv4 Address
+# Based on https://stackoverflow.com/questions/5284147/\
+#       validating-ipv4-addresses-with-regexp
+IPV4_ADDR_RE = re.compile(
+    r"^(?P<ip>((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}"
+    r"(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?))$"
+)
+
+# Used to validate an IPv6 Address
+# Based on https://stackoverflow.com/questions/53497/\
+#              regular-expression-that-matches-valid-ipv6-addresses
+#
+# IPV6 URLs should be enclosed in square brackets when placed on a URL
+#   Source: https://tools.ietf.org/html/rfc2732
+#   - For this reason, they are additionally checked for existance
+IPV6_ADDR_RE = re.compile(
+    r"\[?(?P<ip>(([0-9a-f]{1,4}:){7,7}[0-9a-f]{1,4}|([0-9a-f]{1,4}:)"
+    r"{1,7}:|([0-9a-f]{1,4}:){1,6}:[0-9a-f]{1,4}|([0-9a-f]{1,4}:){1,5}"
+    r"(:[0-9a-f]{1,4}){1,2}|([0-9a-f]{1,4}:){1,4}"
+    r"(:[0-9a-f]{1,4}){1,3}|([0-9a-f]{1,4}:){1,3}"
+    r"(:[0-9a-f]{1,4}){1,4}|([0-9a-f]{1,4}:){1,2}"
+    r"(:[0-9a-f]{1,4}){1,5}|[0-9a-f]{1,4}:"
+    r"((:[0-9a-f]{1,4}){1,6})|:((:[0-9a-f]{1,4}){1,7}|:)|"
+    r"fe80:(:[0-9a-f]{0,4}){0,4}%[0-9a-z]{1,}|::"
+    r"(ffff(:0{1,4}){0,1}:){0,1}((25[0-5]"
+    r"|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|"
+    r"1{0,1}[0-9]){0,1}[0-9])|([0-9a-f]{1,4}:){1,4}:((25[0-5]|"
+    r"(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|"
+    r"1{0,1}[0-9]){0,1}[0-9])))\]?",
+    re.I,
+)
+
+# Used to detect a hostname that is made up of nothing but digits and
+# periods (and is therefore treated as an IPv4 Address)
+IPV4_HOSTNAME_RE = re.compile(r"^[0-9.]+$")
+
+# Used to validate each label (the content between the periods) of a hostname
+# - RFC 1123 permits hostname labels to start with digits
+#     - digit must be followed by alpha/numeric so we don't end up
+#       processing IP addresses here
+# - Hostnames can ony be comprised of alpha-numeric characters and the
+#   hyphen (-) character.
+# - Hostnames can not start with the hyphen (-) character.
+# - as a workaround for https://github.com/docker/compose/issues/229 to
+#   being able to address services in other stacks, we also allow
+#   underscores in hostnames (if flag is set accordingly)
+# - labels can not exceed 63 characters
+# - allow single character alpha characters
+HOSTNAME_LABEL_RE = re.compile(
+    r"^([a-z0-9][a-z0-9_-]{1,62}|[a-z_-])(?<![_-])$", re.IGNORECASE
+)
+HOSTNAME_LABEL_NO_UNDERSCORE_RE = re.compile(
+    r"^([a-z0-9][a-z0-9-]{1,62}|[a-z-])(?<!-)$", re.IGNORECASE
+)
+
+# Used to strip everything but the digits from a phone number
+PHONE_NO_STRIP_RE = re.compile(r"[^\d]+")
+
+# Used by parse_bool() to identify a string based boolean setting by the
+# first 2 characters of its lowercase form
+# no = no - False
+# of = short for off - False
+# 0  = int for False
+# fa = short for False - False
+# f  = short for False - False
+# n  = short for No or Never - False
+# ne  = short for Never - False
+# di  = short for Disable(d) - False
+# de  = short for Deny - False
+PARSE_BOOL_FALSE = frozenset(
+    ("de", "di", "ne", "f", "n", "no", "of", "0", "fa")
+)
+
+# ye = yes - True
+# on = short for off - True
+# 1  = int for True
+# tr = short for True - True
+# t  = short for True - True
+# al = short for Always (and Allow) - True
+# en  = short for Enable(d) - True
+PARSE_BOOL_TRUE = frozenset(("en", "al", "t", "y", "ye", "on", "1", "tr"))
+
 # Validate if we're a loadable Python file or not
 VALID_PYTHON_FILE_RE = re.compile(r".+\.py(o|c)?$", re.IGNORECASE)
 
-# validate_regex() utilizes this mapping to track and re-use pre-complied
-# regular expressions
-REGEX_VALIDATE_LOOKUP = {}
+# validate_regex() utilizes this mapping to convert a string of regular
+# expression flags into their respected integer (expected) Python values
+REGEX_VALIDATE_FLAG_MAP = {
+    # Ignore Case
+    "i": re.I,
+    # Multi Line
+    "m": re.M,
+    # Dot Matches All
+    "s": re.S,
+    # Locale Dependant
+    "L": re.L,
+    # Unicode Matching
+    "u": re.U,
+    # Verbose
+    "x": re.X,
+}
 
 
 def is_ipaddr(addr, ipv4=True, ipv6=True):
     """Validates against IPV4 and IPV6 IP Addresses."""
 
-    if ipv4:
-        # Based on https://stackoverflow.com/questions/5284147/\
-        #       validating-ipv4-addresses-with-regexp
-        re_ipv4 = re.compile(
-            r"^(?P<ip>((25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}"
-            r"(25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?))$"
-        )
-        match = re_ipv4.match(addr)
+    # Neither of our regular expressions can match content that doesn't
+    # contain their delimiter, so don't bother running them in that case
+    if ipv4 and "." in addr:
+        match = IPV4_ADDR_RE.match(addr)
         if match is not None:
             # Return our matched IP
             return match.group("ip")
 
-    if ipv6:
-        # Based on https://stackoverflow.com/questions/53497/\
-        #              regular-expression-that-matches-valid-ipv6-addresses
-        #
-        # IPV6 URLs should be enclosed in square brackets when placed on a URL
-        #   Source: https://tools.ietf.org/html/rfc2732
-        #   - For this reason, they are additionally checked for existance
-        re_ipv6 = re.compile(
-            r"\[?(?P<ip>(([0-9a-f]{1,4}:){7,7}[0-9a-f]{1,4}|([0-9a-f]{1,4}:)"
-            r"{1,7}:|([0-9a-f]{1,4}:){1,6}:[0-9a-f]{1,4}|([0-9a-f]{1,4}:){1,5}"
-            r"(:[0-9a-f]{1,4}){1,2}|([0-9a-f]{1,4}:){1,4}"
-            r"(:[0-9a-f]{1,4}){1,3}|([0-9a-f]{1,4}:){1,3}"
-            r"(:[0-9a-f]{1,4}){1,4}|([0-9a-f]{1,4}:){1,2}"
-            r"(:[0-9a-f]{1,4}){1,5}|[0-9a-f]{1,4}:"
-            r"((:[0-9a-f]{1,4}){1,6})|:((:[0-9a-f]{1,4}){1,7}|:)|"
-            r"fe80:(:[0-9a-f]{0,4}){0,4}%[0-9a-z]{1,}|::"
-            r"(ffff(:0{1,4}){0,1}:){0,1}((25[0-5]"
-            r"|(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|"
-            r"1{0,1}[0-9]){0,1}[0-9])|([0-9a-f]{1,4}:){1,4}:((25[0-5]|"
-            r"(2[0-4]|1{0,1}[0-9]){0,1}[0-9])\.){3,3}(25[0-5]|(2[0-4]|"
-            r"1{0,1}[0-9]){0,1}[0-9])))\]?",
-            re.I,
-        )
-
-        match = re_ipv6.match(addr)
+    if ipv6 and ":" in addr:
+        match = IPV6_ADDR_RE.match(addr)
         if match is not None:
             # Return our matched IP between square brackets since that is
             # required for URL formatting as per RFC 2732.
@@ -197,8 +308,13 @@ def is_ipaddr(addr, ipv4=True, ipv6=True):
     return False
 
 
+@lru_cache(maxsize=512)
 def is_hostname(hostname, ipv4=True, ipv6=True, underscore=True):
-    """Validate hostname."""
+    """Validate hostname.
+
+    The same handful of hostnames tend to be validated over and over again
+    (every URL parsed is checked), so results are cached.
+    """
     # The entire hostname, including the delimiting dots, has a maximum of 253
     # ASCII characters.
     if len(hostname) > 253 or len(hostname) == 0:
@@ -212,29 +328,12 @@ def is_hostname(hostname, ipv4=True, ipv6=True, underscore=True):
     labels = hostname.split(".")
 
     # ipv4 check
-    if len(labels) == 4 and re.match(r"^[0-9.]+$", hostname):
+    if len(labels) == 4 and IPV4_HOSTNAME_RE.match(hostname):
         return is_ipaddr(hostname, ipv4=ipv4, ipv6=False)
 
-    # - RFC 1123 permits hostname labels to start with digits
-    #     - digit must be followed by alpha/numeric so we don't end up
-    #       processing IP addresses here
-    # - Hostnames can ony be comprised of alpha-numeric characters and the
-    #   hyphen (-) character.
-    # - Hostnames can not start with the hyphen (-) character.
-    # - as a workaround for https://github.com/docker/compose/issues/229 to
-    #   being able to address services in other stacks, we also allow
-    #   underscores in hostnames (if flag is set accordingly)
-    # - labels can not exceed 63 characters
-    # - allow single character alpha characters
-    allowed = re.compile(
-        (
-            r"^([a-z0-9][a-z0-9_-]{1,62}|[a-z_-])(?<![_-])$"
-            if underscore
-            else r"^([a-z0-9][a-z0-9-]{1,62}|[a-z-])(?<!-)$"
-        ),
-        re.IGNORECASE,
+    allowed = (
+        HOSTNAME_LABEL_RE if underscore else HOSTNAME_LABEL_NO_UNDERSCORE_RE
     )
-
     if not all(allowed.match(x) for x in labels):
         return is_ipaddr(hostname, ipv4=ipv4, ipv6=ipv6)
 
@@ -293,17 +392,32 @@ def is_phone_no(phone, min_len=10):
                 }
     """
 
-    try:
-        if not IS_PHONE_NO.match(phone):
-            # not parseable content as it does not even conform closely to a
-            # phone number)
-            return False
+    if not isinstance(phone, str):
+        # not parseable content
+        return False
 
-    except TypeError:
+    if len(phone) < min_len:
+        # Too short to ever contain enough digits to be a phone number
+        return False
+
+    result = _is_phone_no(phone, min_len)
+
+    # Our results are cached and shared, so always hand back a copy
+    return result.copy() if result else result
+
+
+@lru_cache(maxsize=512)
+def _is_phone_no(phone, min_len):
+    """Performs the actual validation behind is_phone_no(); see it for
+    details."""
+
+    if not IS_PHONE_NO.match(phone):
+        # not parseable content as it does not even conform closely to a
+        # phone number)
         return False
 
     # Tidy phone number up first
-    phone = re.sub(r"[^\d]+", "", phone)
+    phone = PHONE_NO_STRIP_RE.sub("", phone)
     if len(phone) > 14 or len(phone) < min_len:
         # Invalid phone number
         return False
@@ -361,17 +475,27 @@ def is_call_sign(callsign):
         bool: Returns False if the address specified is not a phone number
     """
 
-    try:
-        result = IS_CALL_SIGN.match(callsign)
-        if not result:
-            # not parseable content as it does not even conform closely to a
-            # callsign
-            return False
-
-    except TypeError:
+    if not isinstance(callsign, str):
         # not parseable content
         return False
 
+    result = _is_call_sign(callsign)
+
+    # Our results are cached and shared, so always hand back a copy
+    return result.copy() if result else result
+
+
+@lru_cache(maxsize=512)
+def _is_call_sign(callsign):
+    """Performs the actual validation behind is_call_sign(); see it for
+    details."""
+
+    result = IS_CALL_SIGN.match(callsign)
+    if not result:
+        # not parseable content as it does not even conform closely to a
+        # callsign
+        return False
+
     ssid = result.group("ssid")
     return {
         # always treat call signs as uppercase content
@@ -401,13 +525,28 @@ def is_email(address):
                 }
     """
 
-    try:
-        match = GET_EMAIL_RE.match(address)
-
-    except TypeError:
+    if not isinstance(address, str):
         # not parseable content
         return False
 
+    if "@" not in address:
+        # No email address can be found without an @ symbol; checking for
+        # one first spares us from running our (rather involved) regular
+        # expression against content that will never match it
+        return False
+
+    result = _is_email(address)
+
+    # Our results are cached and shared, so always hand back a copy
+    return result.copy() if result else result
+
+
+@lru_cache(maxsize=512)
+def _is_email(address):
+    """Performs the actual validation behind is_email(); see it for
+    details."""
+
+    match = GET_EMAIL_RE.match(address)
     if match:
         return {
             # The name parsed from the URL (if one exists)
@@ -482,24 +621,19 @@ def parse_qsd(qs, simple=False, plus_to_space=False, sanitize=True):
         else {"qsd": {}}
     )
 
-    pairs = [s2 for s1 in qs.split("&") for s2 in s1.split(";")]
-    for name_value in pairs:
-        nv = name_value.split("=", 1)
-        # Handle case of a control-name with no equal sign
-        if len(nv) != 2:
-            nv.append("")
+    # Both the ampersand (&) and semi-colon (;) delimit our pairs
+    for name_value in qs.replace(";", "&").split("&"):
+        # A control-name with no equal sign is treated as an empty value
+        key, _, val = name_value.partition("=")
 
         # Apprise keys can start with a + symbol; so we need to skip over
         # the very first entry
-        key = "{}{}".format(
-            "" if len(nv[0]) == 0 else nv[0][0],
-            "" if len(nv[0]) <= 1 else nv[0][1:].replace("+", " "),
-        )
+        key = key[:1] + key[1:].replace("+", " ")
 
-        key = unquote(key)
-        key = key if key else ""
+        if plus_to_space:
+            val = val.replace("+", " ")
 
-        val = nv[1].replace("+", " ") if plus_to_space else nv[1]
+        key = unquote(key)
         val = unquote(val)
         val = "" if not val else val.strip()
 
@@ -511,23 +645,12 @@ def parse_qsd(qs, simple=False, plus_to_space=False, sanitize=True):
             # move along
             continue
 
-        # Check for tokens that start with a addition/plus symbol (+)
-        k = NOTIFY_CUSTOM_ADD_TOKENS.match(key)
-        if k is not None:
-            # Store content 'as-is'
-            result["qsd+"][k.group("key")] = val
-
-        # Check for tokens that start with a subtraction/hyphen symbol (-)
-        k = NOTIFY_CUSTOM_DEL_TOKENS.match(key)
-        if k is not None:
-            # Store content 'as-is'
-            result["qsd-"][k.group("key")] = val
-
-        # Check for tokens that start with a colon symbol (:)
-        k = NOTIFY_CUSTOM_COLON_TOKENS.match(key)
-        if k is not None:
-            # Store content 'as-is'
-            result["qsd:"][k.group("key")] = val
+        # Check for tokens that start with an addition/plus symbol (+), a
+        # subtraction/hyphen symbol (-) or a colon symbol (:)
+        target = NOTIFY_CUSTOM_TOKEN_MAP.get(key[:1])
+        if target is not None:
+            # Store content 'as-is' (up to the first new line, if any)
+            result[target][key[1:].partition("\n")[0]] = val
 
     return result
 
@@ -603,6 +726,43 @@ def parse_url(
         # Simple error checking
         return None
 
+    result = _parse_url(
+        url,
+        default_schema,
+        verify_host,
+        strict_port,
+        simple,
+        plus_to_space,
+        sanitize,
+    )
+    if result is None:
+        return None
+
+    # Our results are cached and shared, so always hand back a copy; the
+    # query string dictionaries are copied too since callers may alter them
+    result = result.copy()
+    for key in ("qsd", "qsd+", "qsd-", "qsd:"):
+        if key in result:
+            result[key] = result[key].copy()
+
+    return result
+
+
+@lru_cache(maxsize=512)
+def _parse_url(
+    url,
+    default_schema,
+    verify_host,
+    strict_port,
+    simple,
+    plus_to_space,
+    sanitize,
+):
+    """Performs the actual parsing behind parse_url(); see it for details.
+
+    Results are cached as the same URLs tend to be parsed again and again.
+    """
+
     # Default Results
     result = (
         {
@@ -640,113 +800,169 @@ def parse_url(
         else {}
     )
 
-    qsdata = ""
-    match = VALID_URL_RE.search(url)
-    if match:
-        # Extract basic results (with schema present)
-        result["schema"] = (
-            match.group("schema").lower().strip()
-            if match.group("schema")
-            else default_schema
-        )
-        host = match.group("path").strip() if match.group("path") else ""
-        qsdata = (
-            match.group("kwargs").strip() if match.group("kwargs") else None
-        )
+    # URLs made up of nothing more then an (optional) schema, a hostname, an
+    # (optional) port and an (optional) trailing slash (such as nuxref.com or
+    # http://hostname/) are very common; these can be broken apart without
+    # the need of running them through our full parser below
+    schema, delim, host = url.partition("://")
+    if not delim:
+        schema, host = None, schema
+
+    trailing_slash = host[-1:] == "/"
+    if trailing_slash:
+        host = host[:-1]
+
+    hostname, delim, port = host.partition(":")
+    if (
+        hostname
+        and SIMPLE_URL_HOST_CHARS.issuperset(hostname)
+        and (not delim or (port.isdigit() and port.isascii()))
+        and (schema is None or (schema.isalnum() and schema.isascii()))
+    ):
+        result["schema"] = schema.lower() if schema else default_schema
+        result["host"] = hostname
+        if port:
+            result["port"] = int(port)
+
+        if trailing_slash:
+            result["fullpath"] = "/"
+            result["path"] = "/"
+
+        # No further port parsing is required
+        pmatch = None
 
     else:
-        # Could not extract basic content from the URL
-        return None
-
-    # Parse Query Arugments ?val=key&key=val
-    # while ensuring that all keys are lowercase
-    if qsdata:
-        result.update(
-            parse_qsd(
-                qsdata,
-                simple=simple,
-                plus_to_space=plus_to_space,
-                sanitize=sanitize,
-            )
-        )
-
-    # Now do a proper extraction of data; http:// is just substitued in place
-    # to allow urlparse() to function as expected, we'll swap this back to the
-    # expected schema after.
-    parsed = urlparse(f"http://{host}")
+        # Most other URLs can be broken apart into their location, path and
+        # query string by scanning for their delimiters; anything out of the
+        # ordinary (whitespace, fragments, IPv6 addresses, etc) is left to
+        # our regular expression and urlparse() to sort out
+        schema, delim, host = url.partition("://")
+        host, qmark, qsdata = host.partition("?")
+        if (
+            delim
+            and schema.isalnum()
+            and schema.isascii()
+            and host[:1] not in ("", "/", "\\")
+            and host.isascii()
+            and URL_SCAN_UNSAFE_CHARS.isdisjoint(host)
+            and (qsdata or not qmark)
+            and "\n" not in qsdata
+        ):
+            result["schema"] = schema.lower()
+            qsdata = qsdata.strip()
+            host, slash, path = host.partition("/")
+            path = slash + path
 
-    # Parse results
-    result["host"] = parsed[1].strip()
-    result["fullpath"] = quote(unquote(tidy_path(parsed[2].strip())))
+        else:
+            match = VALID_URL_RE.search(url)
+            if not match:
+                # Could not extract basic content from the URL
+                return None
 
-    try:
-        # Handle trailing slashes removed by tidy_path
-        if result["fullpath"][-1] not in ("/", "\\") and url[-1] in (
-            "/",
-            "\\",
-        ):
-            result["fullpath"] += url.strip()[-1]
+            # Extract basic results (with schema present)
+            result["schema"] = (
+                match.group("schema").lower().strip()
+                if match.group("schema")
+                else default_schema
+            )
+            host = match.group("path").strip() if match.group("path") else ""
+            qsdata = (
+                match.group("kwargs").strip()
+                if match.group("kwargs")
+                else None
+            )
 
-    except IndexError:
-        # No problem, there simply isn't any returned results
-        # and therefore, no trailing slash
-        pass
+            # Now do a proper extraction of data; http:// is just substitued
+            # in place to allow urlparse() to function as expected, we'll
+            # swap this back to the expected schema after.
+            parsed = urlparse(f"http://{host}")
+            host, path = parsed[1], parsed[2]
+
+        # Parse Query Arugments ?val=key&key=val
+        # while ensuring that all keys are lowercase
+        if qsdata:
+            result.update(
+                parse_qsd(
+                    qsdata,
+                    simple=simple,
+                    plus_to_space=plus_to_space,
+                    sanitize=sanitize,
+                )
+            )
 
-    if not result["fullpath"]:
-        if not simple:
-            # Default
-            result["fullpath"] = None
-        else:
-            # Remove entry
-            del result["fullpath"]
+        # Parse results
+        result["host"] = host.strip()
+        result["fullpath"] = quote(unquote(tidy_path(path)))
 
-    else:
-        # Using full path, extract query from path
-        match = VALID_QUERY_RE.search(result["fullpath"])
-        result["path"] = match.group("path")
-        result["query"] = match.group("query")
-        if not result["query"]:
+        try:
+            # Handle trailing slashes removed by tidy_path
+            if result["fullpath"][-1] not in ("/", "\\") and url[-1] in (
+                "/",
+                "\\",
+            ):
+                result["fullpath"] += url[-1]
+
+        except IndexError:
+            # No problem, there simply isn't any returned results
+            # and therefore, no trailing slash
+            pass
+
+        if not result["fullpath"]:
             if not simple:
-                result["query"] = None
+                # Default
+                result["fullpath"] = None
             else:
-                del result["query"]
-
-    with contextlib.suppress(ValueError):
-        (result["user"], result["host"]) = re.split(r"[@]+", result["host"])[
-            :2
-        ]
-
-    if result.get("user") is not None:
-        with contextlib.suppress(ValueError):
-            (result["user"], result["password"]) = re.split(
-                r"[:]+", result["user"]
-            )[:2]
-
-    # Port Parsing
-    pmatch = re.search(
-        r"^(?P<host>(\[[0-9a-f:]+\]|[^:]+)):(?P<port>[^:]*)$", result["host"]
-    )
+                # Remove entry
+                del result["fullpath"]
 
-    if pmatch:
-        # Separate our port from our hostname (if port is detected)
-        result["host"] = pmatch.group("host")
-        try:
-            # If we're dealing with an integer, go ahead and convert it
-            # otherwise return an 'x' which will raise a ValueError
-            #
-            # This small extra check allows us to treat floats/doubles
-            # as strings. Hence a value like '4.2' won't be converted to a 4
-            # (and the .2 lost)
-            result["port"] = int(
-                pmatch.group("port")
-                if re.search(r"[0-9]", pmatch.group("port"))
-                else "x"
-            )
+        else:
+            # Using full path, extract query from path
+            match = VALID_QUERY_RE.search(result["fullpath"])
+            result["path"] = match.group("path")
+            result["query"] = match.group("query")
+            if not result["query"]:
+                if not simple:
+                    result["query"] = None
+                else:
+                    del result["query"]
+
+        # Extract our user and password (if defined) from our host
+        netloc = URL_NETLOC_RE.match(result["host"])
+        result["host"] = netloc.group("host")
+        if netloc.group("user") is not None:
+            result["user"] = netloc.group("user")
+            if netloc.group("password") is not None:
+                result["password"] = netloc.group("password")
+
+        # Port Parsing
+        pmatch = URL_HOST_PORT_RE.search(result["host"])
+
+        if pmatch:
+            # Separate our port from our hostname (if port is detected)
+            result["host"] = pmatch.group("host")
+
+            port = pmatch.group("port")
+            digits = port[1:] if port[:1] == "-" else port
+            if digits.isdecimal() and digits.isascii():
+                # The most common case; an integer we can convert directly
+                result["port"] = int(port)
 
-        except ValueError:
-            if verify_host:
-                # Invalid Host Specified
-                return None
+            else:
+                try:
+                    # If we're dealing with an integer, go ahead and convert
+                    # it otherwise return an 'x' which will raise a ValueError
+                    #
+                    # This small extra check allows us to treat floats/doubles
+                    # as strings. Hence a value like '4.2' won't be converted
+                    # to a 4 (and the .2 lost)
+                    result["port"] = int(
+                        port if URL_PORT_DIGIT_RE.search(port) else "x"
+                    )
+
+                except ValueError:
+                    if verify_host:
+                        # Invalid Host Specified
+                        return None
 
     # Acquire our port (if defined)
     _port = result.get("port")
@@ -760,10 +976,7 @@ def parse_url(
             return None
 
         # Max port is 65535 and min is 1
-        if isinstance(_port, int) and not (
-            not strict_port or (strict_port and _port > 0 and _port <= 65535)
-        ):
-
+        if strict_port and isinstance(_port, int) and not 0 < _port <= 65535:
             # An invalid port was specified
             return None
 
@@ -813,36 +1026,14 @@ def parse_bool(arg, default=False):
     """
 
     if isinstance(arg, str):
-        # no = no - False
-        # of = short for off - False
-        # 0  = int for False
-        # fa = short for False - False
-        # f  = short for False - False
-        # n  = short for No or Never - False
-        # ne  = short for Never - False
-        # di  = short for Disable(d) - False
-        # de  = short for Deny - False
-        if arg.lower()[0:2] in (
-            "de",
-            "di",
-            "ne",
-            "f",
-            "n",
-            "no",
-            "of",
-            "0",
-            "fa",
-        ):
+        # Only the first 2 characters are needed to identify our value
+        arg = arg.lower()[0:2]
+        if arg in PARSE_BOOL_FALSE:
             return False
-        # ye = yes - True
-        # on = short for off - True
-        # 1  = int for True
-        # tr = short for True - True
-        # t  = short for True - True
-        # al = short for Always (and Allow) - True
-        # en  = short for Enable(d) - True
-        elif arg.lower()[0:2] in ("en", "al", "t", "y", "ye", "on", "1", "tr"):
+
+        elif arg in PARSE_BOOL_TRUE:
             return True
+
         # otherwise
         return default
 
@@ -873,7 +1064,7 @@ def parse_phone_no(*args, store_unparseable=True, prefix=False, **kwargs):
                 # at a higher level can at least report this to the end user
                 # and hopefully give them some indication as to what they
                 # may have done wrong.
-                result += list(filter(bool, re.split(STRING_DELIMITERS, arg)))
+                result += STRING_DELIMITED_RE.findall(arg)
 
         elif isinstance(arg, (set, list, tuple)):
             # Use recursion to handle the list of phone numbers
@@ -903,7 +1094,7 @@ def parse_call_sign(*args, store_unparseable=True, **kwargs):
                 # at a higher level can at least report this to the end user
                 # and hopefully give them some indication as to what they
                 # may have done wrong.
-                result += list(filter(bool, re.split(STRING_DELIMITERS, arg)))
+                result += STRING_DELIMITED_RE.findall(arg)
 
         elif isinstance(arg, (set, list, tuple)):
             # Use recursion to handle the list of call signs
@@ -921,7 +1112,9 @@ def parse_emails(*args, store_unparseable=True, **kwargs):
     result = []
     for arg in args:
         if isinstance(arg, str) and arg:
-            _result = EMAIL_DETECTION_RE.findall(arg)
+            # No email can be detected without an @ symbol; checking for one
+            # first spares us from running our regular expression
+            _result = EMAIL_DETECTION_RE.findall(arg) if "@" in arg else None
             if _result:
                 result += _result
 
@@ -933,7 +1126,7 @@ def parse_emails(*args, store_unparseable=True, **kwargs):
                 # at a higher level can at least report this to the end user
                 # and hopefully give them some indication as to what they
                 # may have done wrong.
-                result += list(filter(bool, re.split(STRING_DELIMITERS, arg)))
+                result += STRING_DELIMITED_RE.findall(arg)
 
         elif isinstance(arg, (set, list, tuple)):
             # Use recursion to handle the list of Emails
@@ -953,33 +1146,24 @@ def url_assembly(encode=False, **kwargs):
     _quote = quote if encode else _no_encode
 
     # Determine Authentication
+    user = kwargs.get("user")
+    password = kwargs.get("password")
     auth = ""
-    if kwargs.get("user") is not None and kwargs.get("password") is not None:
+    if user is not None and password is not None:
+        auth = f"{_quote(user, safe='')}:{_quote(password, safe='')}@"
 
-        auth = "{user}:{password}@".format(
-            user=_quote(kwargs.get("user"), safe=""),
-            password=_quote(kwargs.get("password"), safe=""),
-        )
+    elif user is not None:
+        auth = f"{_quote(user, safe='')}@"
 
-    elif kwargs.get("user") is not None:
-        auth = "{user}@".format(
-            user=_quote(kwargs.get("user"), safe=""),
-        )
-
-    return "{schema}://{auth}{hostname}{port}{fullpath}{params}".format(
-        schema="" if not kwargs.get("schema") else kwargs.get("schema"),
-        auth=auth,
+    port = kwargs.get("port")
+    qsd = kwargs.get("qsd")
+    return (
+        f"{kwargs.get('schema') or ''}://{auth}"
         # never encode hostname since we're expecting it to be a valid one
-        hostname="" if not kwargs.get("host") else kwargs.get("host", ""),
-        port=(
-            "" if not kwargs.get("port") else ":{}".format(kwargs.get("port"))
-        ),
-        fullpath=_quote(kwargs.get("fullpath", ""), safe="/"),
-        params=(
-            ""
-            if not kwargs.get("qsd")
-            else "?{}".format(urlencode(kwargs.get("qsd")))
-        ),
+        f"{kwargs.get('host') or ''}"
+        f"{f':{port}' if port else ''}"
+        f"{_quote(kwargs.get('fullpath', ''), safe='/')}"
+        f"{f'?{urlencode(qsd)}' if qsd else ''}"
     )
 
 
@@ -1018,6 +1202,39 @@ def urlencode(query, doseq=False, safe="", encoding=None, errors=None):
     )
 
 
+def unquote(content, encoding="utf-8", errors="replace"):
+    """Replace %xx escapes by their single-character equivalent.
+
+    Wrapper to Python's unquote(); strings made up entirely of ASCII
+    characters (which is nearly always the case with URLs) are decoded in a
+    single pass straight from their byte representation.
+
+    Args:
+        content (str): The quoted URI string you wish to unquote
+        encoding (:obj:`str`, optional): encoding type
+        errors (:obj:`str`, errors): how to handle invalid character found
+            in encoded string (defined by encoding)
+
+    Returns:
+        str: The unquoted URI string
+    """
+    # Mirror Python's unquote() handling of unset values
+    encoding = encoding or "utf-8"
+    errors = errors or "replace"
+
+    if not isinstance(content, str):
+        return _unquote(content, encoding=encoding, errors=errors)
+
+    if "%" not in content:
+        # Nothing to decode
+        return content
+
+    if content.isascii():
+        return unquote_to_bytes(content).decode(encoding, errors)
+
+    return _unquote(content, encoding=encoding, errors=errors)
+
+
 def parse_urls(*args, store_unparseable=True, **kwargs):
     """Takes a string containing URLs separated by comma's and/or spaces and
     returns a list."""
@@ -1025,7 +1242,10 @@ def parse_urls(*args, store_unparseable=True, **kwargs):
     result = []
     for arg in args:
         if isinstance(arg, str) and arg:
-            _result = URL_DETECTION_RE.findall(arg)
+            # No URL can be detected without a schema delimiter; checking for
+            # one first spares us from running our regular expression (which
+            # is costly against long runs of alpha-numeric characters)
+            _result = URL_DETECTION_RE.findall(arg) if "://" in arg else None
             if _result:
                 result += _result
 
@@ -1037,7 +1257,7 @@ def parse_urls(*args, store_unparseable=True, **kwargs):
                 # at a higher level can at least report this to the end user
                 # and hopefully give them some indication as to what they
                 # may have done wrong.
-                result += list(filter(bool, re.split(STRING_DELIMITERS, arg)))
+                result += STRING_DELIMITED_RE.findall(arg)
 
         elif isinstance(arg, (set, list, tuple)):
             # Use recursion to handle the list of URLs
@@ -1065,37 +1285,40 @@ def parse_list(*args, cast=None, allow_whitespace=True):
     semicolons, and pipes as delimiters
     """
 
-    result = []
+    regex = (
+        STRING_DELIMITED_RE if allow_whitespace else STRING_DELIMITED_NO_WS_RE
+    )
+
+    # The entries found in the strings passed in directly
+    result = set()
+
+    # The entries found in any (nested) set, list or tuple passed in
+    nested = set()
+
     for arg in args:
         if not isinstance(arg, (str, set, list, bool, tuple)) and arg and cast:
             arg = cast(arg)
 
         if isinstance(arg, str):
-            result += re.split(
-                (
-                    STRING_DELIMITERS
-                    if allow_whitespace
-                    else STRING_DELIMITERS_NO_WS
-                ),
-                arg,
-            )
+            result.update(regex.findall(arg))
 
         elif isinstance(arg, (set, list, tuple)):
-            result += parse_list(*arg, allow_whitespace=allow_whitespace)
-
-    #
-    # filter() eliminates any empty entries
-    #
-    # Since Python v3 returns a filter (iterator) whereas Python v2 returned
-    # a list, we need to change it into a list object to remain compatible with
-    # both distribution types.
-    return (
-        sorted(filter(bool, list(set(result))))
-        if allow_whitespace
-        else sorted(
-            [x.strip() for x in filter(bool, list(set(result))) if x.strip()]
-        )
-    )
+            # Walk through our nested content without the need of recursion
+            stack = [arg]
+            while stack:
+                for entry in stack.pop():
+                    if isinstance(entry, str):
+                        nested.update(regex.findall(entry))
+
+                    elif isinstance(entry, (set, list, tuple)):
+                        stack.append(entry)
+
+    if allow_whitespace:
+        return sorted(result | nested)
+
+    # Nested entries are always combined in their tidied form
+    result.update(x.strip() for x in nested)
+    return sorted([x.strip() for x in result if x.strip()])
 
 
 def validate_regex(value, regex=r"[^\s]+", flags=re.I, strip=True, fmt=None):
@@ -1118,44 +1341,12 @@ def validate_regex(value, regex=r"[^\s]+", flags=re.I, strip=True, fmt=None):
     substitute the matched groups and format a response.
     """
 
-    if flags:
-        # Regex String -> Flag Lookup Map
-        _map = {
-            # Ignore Case
-            "i": re.I,
-            # Multi Line
-            "m": re.M,
-            # Dot Matches All
-            "s": re.S,
-            # Locale Dependant
-            "L": re.L,
-            # Unicode Matching
-            "u": re.U,
-            # Verbose
-            "x": re.X,
-        }
-
-        if isinstance(flags, str):
-            # Convert a string of regular expression flags into their
-            # respected integer (expected) Python values and perform
-            # a bit-wise or on each match found:
-            flags = reduce(
-                lambda x, y: x | y, [0] + [_map[f] for f in flags if f in _map]
-            )
-
-    else:
-        # Handles None/False/'' cases
-        flags = 0
-
-    # A key is used to store our compiled regular expression
-    key = f"{regex}{flags}"
-
-    if key not in REGEX_VALIDATE_LOOKUP:
-        REGEX_VALIDATE_LOOKUP[key] = re.compile(regex, flags)
+    # Acquire our pre-compiled regular expression
+    pattern = _validate_regex_compile(regex, flags)
 
     # Perform our lookup usig our pre-compiled result
     try:
-        result = REGEX_VALIDATE_LOOKUP[key].match(value)
+        result = pattern.match(value)
         if not result:
             # let outer exception handle this
             raise TypeError
@@ -1169,3 +1360,29 @@ def validate_regex(value, regex=r"[^\s]+", flags=re.I, strip=True, fmt=None):
 
     # Return our response
     return value.strip() if strip else value
+
+
+@lru_cache(maxsize=1024)
+def _validate_regex_compile(regex, flags):
+    """Compiles (and tracks for re-use) the regular expressions used by
+    validate_regex()."""
+
+    if not flags:
+        # Handles None/False/'' cases
+        flags = 0
+
+    elif isinstance(flags, str):
+        # Convert a string of regular expression flags into their
+        # respected integer (expected) Python values and perform
+        # a bit-wise or on each match found:
+        flags = reduce(
+            lambda x, y: x | y,
+            [0]
+            + [
+                REGEX_VALIDATE_FLAG_MAP[f]
+                for f in flags
+                if f in REGEX_VALIDATE_FLAG_MAP
+            ],
+        )
+
+    return re.compile(regex, flags)
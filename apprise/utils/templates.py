@@ -24,6 +24,7 @@
 # CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
+from functools import lru_cache
 import json
 import re
 
@@ -67,10 +68,28 @@ def apply_template(template, app_mode=TemplateType.RAW, **kwargs):
     # Our escape function
     fn = _escape_json if app_mode == TemplateType.JSON else _escape_raw
 
-    lookup = [re.escape(x) for x in kwargs]
+    if "{{" not in template:
+        # Nothing to swap
+        return template
+
+    # Acquire our (pre-compiled) keyword mask
+    mask_r = _template_mask(tuple(kwargs))
+
+    # we index 2 characters off the head and 2 characters from the tail
+    # to drop the '{{' and '}}' surrounding our match so that we can
+    # re-index it back into our list
+    return mask_r.sub(lambda x: fn(kwargs[x.group()[2:-2].strip()]), template)
+
+
+@lru_cache(maxsize=128)
+def _template_mask(keywords):
+    """Compiles (and tracks for re-use) the regular expression used by
+    apply_template() to match the keywords specified."""
+
+    lookup = [re.escape(x) for x in keywords]
 
     # Compile this into a list
-    mask_r = re.compile(
+    return re.compile(
         re.escape("{{")
         + r"\s*("
         + "|".join(lookup)
@@ -78,8 +97,3 @@ def apply_template(template, app_mode=TemplateType.RAW, **kwargs):
         + re.escape("}}"),
         re.IGNORECASE,
     )
-
-    # we index 2 characters off the head and 2 characters from the tail
-    # to drop the '{{' and '}}' surrounding our match so that we can
-    # re-index it back into our list
-    return mask_r.sub(lambda x: fn(kwargs[x.group()[2:-2].strip()]), template)
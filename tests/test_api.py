@@ -54,6 +54,7 @@ from apprise import (
     PrivacyMode,
     URLBase,
     __version__,
+    common,
 )
 from apprise.locale import LazyTranslation, gettext_lazy as _
 from apprise.plugins.base import RequirementsSpec
@@ -900,6 +901,26 @@ def test_apprise_schemas():
         assert len(schemas) == 0
 
 
+def test_apprise_common_types():
+    """
+    API: Apprise() common type definitions
+
+    """
+    # Our verification sets must always reflect the types they represent
+    for types, enum in (
+        (common.NOTIFY_TYPES, common.NotifyType),
+        (common.NOTIFY_IMAGE_SIZES, common.NotifyImageSize),
+        (common.NOTIFY_FORMATS, common.NotifyFormat),
+        (common.OVERFLOW_MODES, common.OverflowMode),
+        (common.CONFIG_FORMATS, common.ConfigFormat),
+        (common.CONTENT_INCLUDE_MODES, common.ContentIncludeMode),
+        (common.CONTENT_LOCATIONS, common.ContentLocation),
+        (common.PERSISTENT_STORE_MODES, common.PersistentStoreMode),
+        (common.PERSISTENT_STORE_STATES, common.PersistentStoreState),
+    ):
+        assert types == {e.value for e in enum}
+
+
 def test_apprise_urlbase_object():
     """
     API: Apprise() URLBase object testing
@@ -27,10 +27,12 @@
 
 # Disable logging for a cleaner testing output
 import logging
+from unittest import mock
 
 from helpers import AppriseURLTester
 import requests
 
+from apprise import NotifyType
 from apprise.plugins.notifico import NotifyNotifico
 
 logging.disable(logging.CRITICAL)
@@ -171,3 +173,80 @@ def test_plugin_notifico_urls():
 
     # Run our general tests
     AppriseURLTester(tests=apprise_url_tests).run_all()
+
+
+@mock.patch("requests.get")
+def test_plugin_notifico_payload(mock_get):
+    """NotifyNotifico() Payload."""
+
+    # Prepare our mock response
+    mock_get.return_value = requests.Request()
+    mock_get.return_value.status_code = requests.codes.ok
+
+    # Colors are kept and included in our prefix
+    obj = NotifyNotifico(project_id="1234", msghook="ckhrjW8w672m6HG")
+    assert obj.notify(body="\\x0304body", notify_type=NotifyType.SUCCESS)
+    assert mock_get.call_count == 1
+    assert mock_get.call_args[1]["params"]["payload"] == (
+        "\x0309[✔]\x03 \x02Apprise\x0f: \\x0304body\x0f"
+    )
+
+    # Colors are stripped from both the prefix and the body
+    mock_get.reset_mock()
+    obj = NotifyNotifico(
+        project_id="1234", msghook="ckhrjW8w672m6HG", color=False
+    )
+    assert obj.notify(body="\\x0304body", notify_type=NotifyType.FAILURE)
+    assert mock_get.call_count == 1
+    assert mock_get.call_args[1]["params"]["payload"] == "[✗] Apprise: body"
+
+    # Toggling our color flag after construction is honoured
+    mock_get.reset_mock()
+    obj = NotifyNotifico(project_id="1234", msghook="ckhrjW8w672m6HG")
+    obj.color = False
+    assert obj.notify(body="\\x0304body", notify_type=NotifyType.INFO)
+    assert mock_get.call_args[1]["params"]["payload"] == "[i] Apprise: body"
+
+    mock_get.reset_mock()
+    obj.color = True
+    assert obj.notify(body="\\x0304body", notify_type=NotifyType.INFO)
+    assert mock_get.call_args[1]["params"]["payload"] == (
+        "\x0310[i]\x03 \x02Apprise\x0f: \\x0304body\x0f"
+    )
+
+    # The same applies when no prefix is used
+    mock_get.reset_mock()
+    obj.prefix = False
+    obj.color = False
+    assert obj.notify(body="\\x0304body", notify_type=NotifyType.INFO)
+    assert mock_get.call_args[1]["params"]["payload"] == "body"
+
+    # No prefix at all
+    mock_get.reset_mock()
+    obj = NotifyNotifico(
+        project_id="1234", msghook="ckhrjW8w672m6HG", prefix=False
+    )
+    assert obj.notify(body="body", notify_type=NotifyType.INFO)
+    assert mock_get.call_count == 1
+    assert mock_get.call_args[1]["params"]["payload"] == "body"
+
+
+def test_plugin_notifico_url():
+    """NotifyNotifico() URL Generation."""
+
+    obj = NotifyNotifico(project_id="1234", msghook="ckhrjW8w672m6HG")
+    url = obj.url()
+    assert url.startswith("notifico://1234/ckhrjW8w672m6HG/?")
+    assert "color=yes" in url
+
+    assert obj.url() == url
+    assert obj.url(privacy=True).startswith("notifico://1...4/c...G/?")
+
+    # Changing our state is reflected in the next URL generated
+    obj.color = False
+    assert "color=no" in obj.url()
+    obj.verify_certificate = False
+    assert "verify=no" in obj.url()
+    obj.project_id = "22"
+    obj.msghook = "bbb"
+    assert obj.url().startswith("notifico://22/bbb/?")